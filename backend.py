@@ -2,15 +2,24 @@ from flask import Flask, request, jsonify, send_from_directory
 import os
 import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xarray as xr
 import numpy as np
 import re
+import shutil
 import sys
 import json
+from collections import OrderedDict
+import threading
 import urllib3
 import certifi
-from time import sleep
+from time import sleep, time
 import getpass
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+from extraction import read_box_means
 from urllib.request import HTTPPasswordMgrWithDefaultRealm, HTTPBasicAuthHandler, build_opener, install_opener, HTTPCookieProcessor, Request
 from http.cookiejar import CookieJar
 
@@ -21,10 +30,83 @@ app = Flask(__name__, static_folder="static")
 CACHE_DIR = "cache"
 os.makedirs(CACHE_DIR, exist_ok=True)
 
+# Month listings of past years never change, so they are kept on disk
+INDEX_PATH = os.path.join(CACHE_DIR, "dir_index.json")
+INDEX_TTL = 30 * 24 * 3600  # seconds
+
+# Downloaded files are evicted least-recently-used first past this size
+CACHE_MAX_BYTES = int(os.environ.get("CACHE_MAX_BYTES", 5 * 1024**3))
+
 NETRC_PATH = ".netrc"
 os.environ["NETRC"] = NETRC_PATH
 
 BASE_URL = "https://goldsmr4.gesdisc.eosdis.nasa.gov/data/MERRA2/M2SDNXSLV.5.12.4"
+OPENDAP_URL = "https://goldsmr4.gesdisc.eosdis.nasa.gov/opendap/MERRA2/M2SDNXSLV.5.12.4"
+# Download threads shared by all requests in this process; matches the
+# session's connection pool so every thread can hold a keep-alive connection
+DOWNLOAD_WORKERS = 32
+# Matched against the raw listing bytes to skip decoding the whole page
+FILE_RE = re.compile(rb'href="(MERRA2_\d+\.statD_2d_slv_Nx\.\d+\.nc4)"')
+
+# With MERRA2_OPENDAP=1 only the lat/lon box is fetched over OPeNDAP instead
+# of whole daily files. Needs netCDF4 built with DAP support and a .dodsrc
+# pointing at the Earthdata .netrc.
+USE_OPENDAP = os.environ.get("MERRA2_OPENDAP") == "1"
+
+# MERRA-2 is on a fixed 0.5° x 0.625° grid, so the coordinates are built once
+# here instead of being decoded from every file
+MERRA2_LAT = np.arange(361) * 0.5 - 90.0
+MERRA2_LON = np.arange(576) * 0.625 - 180.0
+
+EARTHDATA_AUTH_HOST = "urs.earthdata.nasa.gov"
+
+class EarthdataSession(requests.Session):
+    # requests drops Authorization on cross-host redirects; keep it for the
+    # hop between the data server and the Earthdata login host. The rest of
+    # rebuild_auth, including the .netrc lookup, is left to requests.
+    def should_strip_auth(self, old_url, new_url):
+        hosts = (requests.utils.urlparse(old_url).hostname,
+                 requests.utils.urlparse(new_url).hostname)
+        if EARTHDATA_AUTH_HOST in hosts:
+            return False
+        return super().should_strip_auth(old_url, new_url)
+
+# Shared session so the download threads reuse keep-alive TLS connections.
+# Credentials are set once from the environment; without them requests falls
+# back to the .netrc pointed to by NETRC.
+SESSION = EarthdataSession()
+if os.environ.get("EARTHDATA_USER") and os.environ.get("EARTHDATA_PASS"):
+    SESSION.auth = (os.environ["EARTHDATA_USER"], os.environ["EARTHDATA_PASS"])
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=DOWNLOAD_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+
+# One long-lived pool shared by all requests; it caps concurrent listings
+# and downloads across requests at DOWNLOAD_WORKERS
+DOWNLOAD_POOL = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="download")
+
+# HDF5 decoding holds the GIL, so box reads run in worker processes. spawn
+# keeps the workers clear of this process's threads and HDF5 state, and the
+# workers only import the small extraction module, not this one.
+def make_extract_pool():
+    return ProcessPoolExecutor(
+        max_workers=min(4, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+extract_pool = make_extract_pool()
+extract_pool_lock = threading.Lock()
+
+def reset_extract_pool(broken):
+    # A crashed worker (e.g. HDF5 aborting on a corrupt file) breaks the whole
+    # pool for good; swap in a fresh one unless another thread already has
+    global extract_pool
+    with extract_pool_lock:
+        if extract_pool is broken:
+            extract_pool = make_extract_pool()
+    broken.shutdown(wait=False)
 
 # ------------------------------
 # Logging
@@ -36,14 +118,53 @@ def log(msg):
 # ------------------------------
 # Existing climate functions
 # ------------------------------
+def load_dir_index():
+    try:
+        with open(INDEX_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+DIR_INDEX = load_dir_index()
+index_lock = threading.Lock()
+
+def save_dir_index_entry(key, files, last_modified=None, etag=None):
+    with index_lock:
+        # Merge with the file on disk so other workers' entries are kept
+        index = load_dir_index()
+        index[key] = {"files": files, "fetched": time(),
+                      "last_modified": last_modified, "etag": etag}
+        tmp_path = f"{INDEX_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, INDEX_PATH)
+        DIR_INDEX.update(index)
+
 def list_month_files(year, month):
+    key = f"{year}-{month:02d}"
+    entry = DIR_INDEX.get(key)
+    if entry and time() - entry["fetched"] < INDEX_TTL:
+        return entry["files"]
+
     url = f"{BASE_URL}/{year}/{month:02d}/"
+    # Revalidate an expired entry instead of refetching the whole page
+    headers = {}
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
     log(f"Listing files at {url}")
     try:
-        r = requests.get(url, timeout=15)
+        r = SESSION.get(url, headers=headers, timeout=15)
+        if r.status_code == 304 and entry:
+            log(f"Listing for {year}-{month:02d} not modified")
+            save_dir_index_entry(key, entry["files"], entry.get("last_modified"), entry.get("etag"))
+            return entry["files"]
         if r.status_code == 200:
-            files = re.findall(r'href="(MERRA2_\d+\.statD_2d_slv_Nx\.\d+\.nc4)"', r.text)
+            files = [m.decode() for m in FILE_RE.findall(r.content)]
             log(f"Found {len(files)} files for {year}-{month:02d}")
+            if files:
+                save_dir_index_entry(key, files, r.headers.get("Last-Modified"), r.headers.get("ETag"))
             return files
         else:
             log(f"[WARN] Failed to list {url}, status {r.status_code}")
@@ -66,60 +187,171 @@ def download_file(url):
     filename = os.path.join(CACHE_DIR, url.split("/")[-1])
     if os.path.exists(filename):
         log(f"Using cached file: {filename}")
+        # Mark as recently used for evict_cache
+        try:
+            os.utime(filename)
+        except OSError:
+            pass
         return filename
     try:
         log(f"Downloading {url} ...")
-        response = requests.get(url, stream=True, timeout=30)
-        if response.status_code == 200:
-            with open(filename, "wb") as f:
-                for chunk in response.iter_content(1024):
-                    f.write(chunk)
-            log(f"Downloaded successfully: {filename}")
-            return filename
-        else:
-            log(f"[ERROR] Failed to download {url}, status {response.status_code}")
-            return None
+        # Closing the response returns its connection to the shared pool
+        with SESSION.get(url, stream=True, timeout=30) as response:
+            if response.status_code == 200:
+                response.raw.decode_content = True
+                # Write under a temporary name so a failed transfer never
+                # leaves a truncated file that later looks like a cache hit
+                tmp_path = f"{filename}.{os.getpid()}.{threading.get_ident()}.part"
+                try:
+                    with open(tmp_path, "wb") as f:
+                        shutil.copyfileobj(response.raw, f, length=1 << 20)
+                    os.replace(tmp_path, filename)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+                log(f"Downloaded successfully: {filename}")
+                return filename
+            else:
+                log(f"[ERROR] Failed to download {url}, status {response.status_code}")
+                return None
     except Exception as e:
         log(f"[ERROR] Download error for {url}: {e}")
         return None
 
-def extract_daily_averages(filename, lat_center, lon_center):
-    log(f"Extracting data from {filename} at lat={lat_center}, lon={lon_center}")
-    ds = xr.open_dataset(filename)
-    subset = ds.sel(
-        lat=slice(lat_center - 0.5, lat_center + 0.5),
-        lon=slice(lon_center - 0.5, lon_center + 0.5),
-    )
-    t2m_avg = float(subset["T2MMEAN"].mean() - 273.15)
-    prectot_avg = float(subset["TPRECMAX"].mean() * 86400)  # mm/day approx.
-    ds.close()
-    log(f"Extracted: T2M={t2m_avg:.2f}°C, Precip={prectot_avg:.2f} mm/day")
-    return t2m_avg, prectot_avg
+cache_lock = threading.Lock()
+
+def evict_cache():
+    # Only one thread evicts at a time; the others skip rather than wait
+    if not cache_lock.acquire(blocking=False):
+        return
+    try:
+        # mtime is refreshed on every hit, so it tracks last use even on
+        # noatime mounts
+        files = []
+        for entry in os.scandir(CACHE_DIR):
+            if entry.path == INDEX_PATH or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue  # removed by another worker
+            files.append((st.st_mtime, st.st_size, entry.path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                log(f"Evicted cached file: {path}")
+            except OSError as e:
+                log(f"[WARN] Could not evict {path}: {e}")
+    finally:
+        cache_lock.release()
+
+def grid_window(lat_center, lon_center):
+    # Index bounds matching a label slice of (c - 0.5, c + 0.5) on each axis
+    i0 = int(np.searchsorted(MERRA2_LAT, lat_center - 0.5))
+    i1 = int(np.searchsorted(MERRA2_LAT, lat_center + 0.5, side="right"))
+    j0 = int(np.searchsorted(MERRA2_LON, lon_center - 0.5))
+    j1 = int(np.searchsorted(MERRA2_LON, lon_center + 0.5, side="right"))
+    return i0, i1, j0, j1
+
+# LRU of box means in this process, keyed on (source, i0, i1, j0, j1) rather
+# than lat/lon, so nearby coordinates that cover the same grid points share
+# one entry and warm requests never reach extract_pool
+BOX_MEANS_CACHE_SIZE = 2048
+box_means_cache = OrderedDict()
+box_means_lock = threading.Lock()
+
+def cached_box_means(keys):
+    with box_means_lock:
+        hits = {key: box_means_cache[key] for key in keys if key in box_means_cache}
+        for key in hits:
+            box_means_cache.move_to_end(key)
+    return hits
+
+def store_box_means(means):
+    with box_means_lock:
+        for key, value in means.items():
+            box_means_cache[key] = value
+            box_means_cache.move_to_end(key)
+        while len(box_means_cache) > BOX_MEANS_CACHE_SIZE:
+            box_means_cache.popitem(last=False)
+
+def extract_historical_series(sources, lat_center, lon_center):
+    # sources are cached file paths or OPeNDAP URLs; netCDF4 opens both and,
+    # for a URL, only requests the sliced hyperslab. The grid window is
+    # resolved once, only cache misses are read in extract_pool, and the
+    # per-year means come back as arrays for vectorised reductions.
+    log(f"Extracting {len(sources)} files at lat={lat_center}, lon={lon_center}")
+    window = grid_window(lat_center, lon_center)
+    keys = [(src, *window) for src in sources]
+    means = cached_box_means(keys)
+    misses = [key for key in keys if key not in means]
+    pool = extract_pool
+    try:
+        futures = [pool.submit(read_box_means, *key) for key in misses]
+    except BrokenProcessPool:
+        # Broken by a crash in another request; retry once on a fresh pool
+        reset_extract_pool(pool)
+        pool = extract_pool
+        futures = [pool.submit(read_box_means, *key) for key in misses]
+    new_means = {}
+    for key, future in zip(misses, futures):
+        try:
+            new_means[key] = future.result()
+        except BrokenProcessPool:
+            log(f"[ERROR] Extraction worker crashed, skipping {key[0]}")
+            reset_extract_pool(pool)
+        except (OSError, RuntimeError) as e:
+            # netCDF4 open/read failures (e.g. OPeNDAP auth or server errors)
+            # drop that year, as a failed download does
+            log(f"[ERROR] Could not read {key[0]}: {e}")
+            if not key[0].startswith(OPENDAP_URL):
+                # A corrupt cached file would otherwise be skipped on every
+                # request; remove it so the next one downloads it again
+                try:
+                    os.remove(key[0])
+                    log(f"Removed unreadable cached file: {key[0]}")
+                except OSError:
+                    pass
+    store_box_means(new_means)
+    means.update(new_means)
+    values = np.array([means[key] for key in keys if key in means], dtype=float).reshape(-1, 2)
+    return values[:, 0], values[:, 1]
+
+def fetch_year_file(year, month, day, window):
+    fname = find_file_for_date(year, month, day)
+    if not fname:
+        log(f"No file for {year}-{month:02d}-{day:02d}")
+        return None
+    if USE_OPENDAP:
+        return f"{OPENDAP_URL}/{year}/{month:02d}/{fname}"
+    path = os.path.join(CACHE_DIR, fname)
+    # Means already in box_means_cache need no file, even if it was evicted
+    if cached_box_means([(path, *window)]):
+        return path
+    return download_file(f"{BASE_URL}/{year}/{month:02d}/{fname}")
 
 def compute_historical_stats(day, month, lat, lon, years_back=15):
     today = datetime.date.today()
-    t2m_vals = []
-    rainfall_occurrences = []
-    heat_occurrences = []
-
     log(f"Computing historical stats for {day:02d}/{month:02d} over {years_back} years")
-    for y in range(today.year - years_back, today.year):
-        log(f"Processing year {y}")
-        fname = find_file_for_date(y, month, day)
-        if fname:
-            url = f"{BASE_URL}/{y}/{month:02d}/{fname}"
-            f = download_file(url)
-            if f:
-                t2m, prec = extract_daily_averages(f, lat, lon)
-                t2m_vals.append(t2m)
-                rainfall_occurrences.append(1 if prec > 2 else 0)
-                heat_occurrences.append(1 if t2m > 35 else 0)
-        else:
-            log(f"No file for {y}-{month:02d}-{day:02d}")
+    years = range(today.year - years_back, today.year)
+    # Listing and downloading are network-bound, so fetch all years concurrently
+    window = grid_window(lat, lon)
+    paths = list(DOWNLOAD_POOL.map(lambda y: fetch_year_file(y, month, day, window), years))
 
-    avg_t2m = np.mean(t2m_vals) if t2m_vals else None
-    rainfall_freq_percent = int(np.mean(rainfall_occurrences) * 100) if rainfall_occurrences else None
-    heat_freq_percent = int(np.mean(heat_occurrences) * 100) if heat_occurrences else None
+    t2m_vals, prec_vals = extract_historical_series([f for f in paths if f], lat, lon)
+
+    if t2m_vals.size:
+        avg_t2m = float(t2m_vals.mean())
+        rainfall_freq_percent = int((prec_vals > 2).mean() * 100)
+        heat_freq_percent = int((t2m_vals > 35).mean() * 100)
+    else:
+        avg_t2m = rainfall_freq_percent = heat_freq_percent = None
 
     log(f"Final averages: Temp={avg_t2m}, Rain freq={rainfall_freq_percent}%, Heat freq={heat_freq_percent}%")
     return avg_t2m, rainfall_freq_percent, heat_freq_percent
@@ -129,6 +361,8 @@ def compute_historical_stats(day, month, lat, lon, years_back=15):
 # ------------------------------
 http = urllib3.PoolManager(cert_reqs='CERT_REQUIRED', ca_certs=certifi.where())
 EARTHDATA_SUBSET_URL = 'https://disc.gsfc.nasa.gov/service/subset/jsonwsp'
+# Kept apart from DOWNLOAD_POOL: subset jobs block for minutes while polling
+SUBSET_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="subset")
 
 def get_http_data(request):
     hdrs = {'Content-Type': 'application/json', 'Accept': 'application/json'}
@@ -140,13 +374,82 @@ def get_http_data(request):
         return None
     return response
 
-def compute_wind_speed_stats(lat_center, lon_center, years_back=15):
+def fetch_wind_year_files(y, lat_center, lon_center, opener):
     product = 'M2T1NXSLV_5.12.4'
     varNames = ['U10M', 'V10M']
     diurnalAggregation = '1'
     interp = 'remapbil'
     destGrid = 'cfsr0.5a'
 
+    begTime = f"{y}-01-01"
+    endTime = f"{y}-12-31"
+
+    subset_request = {
+        'methodname': 'subset',
+        'type': 'jsonwsp/request',
+        'version': '1.0',
+        'args': {
+            'role': 'subset',
+            'start': begTime,
+            'end': endTime,
+            'box': [lon_center-0.5, lat_center-0.5, lon_center+0.5, lat_center+0.5],
+            'crop': True,
+            'diurnalAggregation': diurnalAggregation,
+            'mapping': interp,
+            'grid': destGrid,
+            'data': [{'datasetId': product, 'variable': var} for var in varNames]
+        }
+    }
+
+    response = get_http_data(subset_request)
+    if response is None:
+        return []
+    jobId = response['result']['jobId']
+
+    # Monitor job
+    status_request = {'methodname': 'GetStatus', 'version': '1.0', 'type': 'jsonwsp/request', 'args': {'jobId': jobId}}
+    status_resp = response
+    # Back off from 1 s up to 10 s so short jobs are picked up quickly
+    delay = 1.0
+    while status_resp['result']['Status'] in ['Accepted', 'Running']: # type: ignore
+        sleep(delay)
+        delay = min(delay * 1.5, 10.0)
+        status_resp = get_http_data(status_request)
+
+    if status_resp['result']['Status'] != 'Succeeded': # type: ignore
+        log(f"[WARN] Wind job failed for year {y}")
+        return []
+
+    # Get result URLs
+    results_request = {'methodname': 'GetResult', 'version': '1.0', 'type': 'jsonwsp/request',
+                       'args': {'jobId': jobId, 'count': 20, 'startIndex': 0}}
+    results = []
+    count = 0
+    response_result = get_http_data(results_request)
+    count += response_result['result']['itemsPerPage'] # type: ignore
+    results.extend(response_result['result']['items']) # type: ignore
+    total = response_result['result']['totalResults'] # type: ignore
+
+    while count < total:
+        results_request['args']['startIndex'] += 20
+        response_result = get_http_data(results_request)
+        count += response_result['result']['itemsPerPage'] # type: ignore
+        results.extend(response_result['result']['items']) # type: ignore
+
+    urls = [item for item in results if 'start' in item and 'end' in item]
+    filenames = []
+    for item in urls:
+        URL = item['link']
+        DataRequest = Request(URL)
+        DataResponse = opener.open(DataRequest)
+        DataBody = DataResponse.read()
+        file_name = os.path.join(CACHE_DIR, item['label'])
+        with open(file_name, 'wb') as f:
+            f.write(DataBody)
+        filenames.append(file_name)
+    return filenames
+
+def compute_wind_speed_stats(lat_center, lon_center, years_back=15):
     username = os.environ.get("EARTHDATA_USER") or input("EarthData userid: ")
     password = os.environ.get("EARTHDATA_PASS") or getpass.getpass("EarthData password: ")
 
@@ -161,80 +464,22 @@ def compute_wind_speed_stats(lat_center, lon_center, years_back=15):
     high_wind_occurrences = []
 
     today = datetime.date.today()
-    for y in range(today.year - years_back, today.year):
-        begTime = f"{y}-01-01"
-        endTime = f"{y}-12-31"
-
-        subset_request = {
-            'methodname': 'subset',
-            'type': 'jsonwsp/request',
-            'version': '1.0',
-            'args': {
-                'role': 'subset',
-                'start': begTime,
-                'end': endTime,
-                'box': [lon_center-0.5, lat_center-0.5, lon_center+0.5, lat_center+0.5],
-                'crop': True,
-                'diurnalAggregation': diurnalAggregation,
-                'mapping': interp,
-                'grid': destGrid,
-                'data': [{'datasetId': product, 'variable': var} for var in varNames]
-            }
-        }
-
-        response = get_http_data(subset_request)
-        if response is None:
-            continue
-        jobId = response['result']['jobId']
-
-        # Monitor job
-        status_request = {'methodname': 'GetStatus', 'version': '1.0', 'type': 'jsonwsp/request', 'args': {'jobId': jobId}}
-        status_resp = response
-        while status_resp['result']['Status'] in ['Accepted', 'Running']: # type: ignore
-            sleep(5)
-            status_resp = get_http_data(status_request)
-
-        if status_resp['result']['Status'] != 'Succeeded': # type: ignore
-            log(f"[WARN] Wind job failed for year {y}")
-            continue
-
-        # Get result URLs
-        results_request = {'methodname': 'GetResult', 'version': '1.0', 'type': 'jsonwsp/request',
-                           'args': {'jobId': jobId, 'count': 20, 'startIndex': 0}}
-        results = []
-        count = 0
-        response_result = get_http_data(results_request)
-        count += response_result['result']['itemsPerPage'] # type: ignore
-        results.extend(response_result['result']['items']) # type: ignore
-        total = response_result['result']['totalResults'] # type: ignore
-
-        while count < total:
-            results_request['args']['startIndex'] += 20
-            response_result = get_http_data(results_request)
-            count += response_result['result']['itemsPerPage'] # type: ignore
-            results.extend(response_result['result']['items']) # type: ignore
-
-        urls = [item for item in results if 'start' in item and 'end' in item]
-        filenames = []
-        for item in urls:
-            URL = item['link']
-            DataRequest = Request(URL)
-            DataResponse = opener.open(DataRequest)
-            DataBody = DataResponse.read()
-            file_name = os.path.join(CACHE_DIR, item['label'])
-            with open(file_name, 'wb') as f:
-                f.write(DataBody)
-            filenames.append(file_name)
+    years = range(today.year - years_back, today.year)
+    # Subset jobs spend most of their time queued on the server, so submit
+    # and poll every year at once rather than one after another
+    year_files = SUBSET_POOL.map(lambda y: fetch_wind_year_files(y, lat_center, lon_center, opener), years)
 
+    for filenames in year_files:
         for file in filenames:
-            ds = xr.open_dataset(file)
-            u = ds['U10M'].values
-            v = ds['V10M'].values
-            wind = np.sqrt(u**2 + v**2)
+            with xr.open_dataset(file) as ds:
+                u = ds['U10M'].values.astype(np.float32, copy=False)
+                v = ds['V10M'].values.astype(np.float32, copy=False)
+            # hypot does the square, sum and root in one pass without the
+            # u**2 and v**2 temporaries
+            wind = np.hypot(u, v)
             # Daily max wind over the tile
-            daily_max = np.max(wind, axis=0)
+            daily_max = float(wind.max())
             high_wind_occurrences.append(1 if daily_max > 10 else 0)
-            ds.close()
 
     if high_wind_occurrences:
         # Return frequency percent over 15 years
@@ -280,6 +525,8 @@ def climate_stats():
         log(f"[ERROR] Wind computation failed: {e}")
         avg_wind_speed = None
 
+    evict_cache()
+
     # Decide label for precipitation
     if avg_t2m is not None and avg_t2m < -5:
         precip_label = "snow_hail_freq_percent"
@@ -303,4 +550,5 @@ def climate_stats():
 # --- Entry point ---
 if __name__ == "__main__":
     log("Starting Flask server on 0.0.0.0:10000")
-    app.run(host="0.0.0.0", port=10000, debug=True)
+    # Development only; deploy with gunicorn (see README)
+    app.run(host="0.0.0.0", port=10000, debug=False, threaded=True)
@@ -0,0 +1,22 @@
+import netCDF4
+import numpy as np
+
+# Runs in the extraction worker processes, so this module must stay free of
+# Flask, xarray and anything with import-time side effects
+
+KELVIN_OFFSET = np.float32(273.15)
+SECONDS_PER_DAY = np.float32(86400)
+
+def read_box_means(source, i0, i1, j0, j1):
+    # Read only the box straight from the file; xarray's CF decoding and
+    # coordinate setup cost far more than the ~25 values we need
+    with netCDF4.Dataset(source) as nc:
+        # statD fields are gap-free, so return plain ndarrays for both
+        # variables instead of building a masked array per read
+        nc.set_auto_mask(False)
+        t2m = nc.variables["T2MMEAN"][0, i0:i1, j0:j1]
+        prec = nc.variables["TPRECMAX"][0, i0:i1, j0:j1]
+    # Stay in the files' float32; the data carries no float64 precision
+    t2m_avg = float(t2m.mean(dtype=np.float32) - KELVIN_OFFSET)
+    prectot_avg = float(prec.mean(dtype=np.float32) * SECONDS_PER_DAY)  # mm/day approx.
+    return t2m_avg, prectot_avg